@@ -1,13 +1,19 @@
 """Pytest plugin for Neon database branch isolation in tests."""
 
-from pytest_neon.plugin import (
-    NeonBranch,
-    neon_apply_migrations,
-    neon_branch,
-    neon_connection,
-    neon_connection_psycopg,
-    neon_engine,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pytest_neon.plugin import (
+        NeonBranch,
+        neon_apply_migrations,
+        neon_branch,
+        neon_connection,
+        neon_connection_psycopg,
+        neon_engine,
+        neon_engine_connection,
+    )
 
 __version__ = "3.0.1"
 __all__ = [
@@ -17,4 +23,21 @@ __all__ = [
     "neon_connection",
     "neon_connection_psycopg",
     "neon_engine",
+    "neon_engine_connection",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve public names from the plugin module on first access, so that
+    # `import pytest_neon` (e.g. to read __version__) stays cheap.
+    if name in __all__:
+        from pytest_neon import plugin
+
+        value = getattr(plugin, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -9,7 +9,9 @@ Main fixture:
 Connection fixtures (require extras):
     neon_connection: psycopg2 connection (requires psycopg2 extra)
     neon_connection_psycopg: psycopg v3 connection (requires psycopg extra)
-    neon_engine: SQLAlchemy engine (requires sqlalchemy extra)
+    neon_engine: Session-scoped SQLAlchemy engine (requires sqlalchemy extra)
+    neon_engine_connection: SQLAlchemy connection in a transaction that is
+        rolled back after each test (requires sqlalchemy extra)
 
 Architecture:
     Parent Branch (configured or project default)
@@ -48,22 +50,34 @@ For full documentation, see: https://github.com/ZainRizvi/pytest-neon
 from __future__ import annotations
 
 import contextlib
+import importlib
 import json
 import os
 import random
+import re
+import secrets
+import subprocess
+import threading
 import time
 import warnings
 from collections.abc import Callable, Generator
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta, timezone
-from typing import Any, TypeVar
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import pytest
-import requests
-from filelock import FileLock
-from neon_api import NeonAPI
-from neon_api.exceptions import NeonAPIError
-from neon_api.schema import EndpointState
+
+# neon_api (and the pydantic models it loads), requests and filelock are
+# imported where they are first used, so that merely having the plugin
+# installed does not add their import time to every pytest startup.
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import requests
+    from filelock import FileLock
+    from neon_api import NeonAPI
 
 T = TypeVar("T")
 
@@ -75,8 +89,27 @@ DEFAULT_BRANCH_EXPIRY_SECONDS = 600
 # Neon limits: 700 requests/minute (~11/sec), burst up to 40/sec per route
 _RATE_LIMIT_BASE_DELAY = 4.0  # seconds
 _RATE_LIMIT_MAX_TOTAL_DELAY = 90.0  # 1.5 minutes total cap
-_RATE_LIMIT_JITTER_FACTOR = 0.25  # +/- 25% jitter
+_RATE_LIMIT_MIN_DELAY_FRACTION = 0.0  # Fraction of the cap (0 = full jitter)
 _RATE_LIMIT_MAX_ATTEMPTS = 10  # Maximum number of retry attempts
+# Cap on a single backoff delay for endpoint status polls, which are cheap to
+# repeat and sit on the critical path of branch creation
+_ENDPOINT_STATUS_MAX_RETRY_DELAY = 5.0  # seconds
+# Private generator for backoff jitter. Tools like pytest-randomly reseed the
+# global random module with the same seed in every xdist worker, which would
+# make all workers draw identical delays and retry in lockstep.
+_retry_rng = random.Random()
+# Substrings (casefolded) that identify a rate limit in NeonAPIError messages,
+# checked after the cheaper case-sensitive search for the "429" status code
+_RATE_LIMIT_ERROR_MARKERS = ("rate limit", "too many requests")
+
+# Endpoint readiness polling: start fast, back off exponentially up to the cap
+_ENDPOINT_POLL_INITIAL_INTERVAL = 0.25  # seconds
+_ENDPOINT_POLL_MAX_INTERVAL = 1.0  # seconds
+_ENDPOINT_ACTIVE_STATE = "active"  # neon_api.schema.EndpointState.active.value
+
+# Polling for other xdist workers to finish before deleting the shared branch
+_WORKERS_DONE_POLL_INITIAL_INTERVAL = 0.05  # seconds
+_WORKERS_DONE_POLL_MAX_INTERVAL = 1.0  # seconds
 
 
 class NeonRateLimitError(Exception):
@@ -88,25 +121,31 @@ class NeonRateLimitError(Exception):
 def _calculate_retry_delay(
     attempt: int,
     base_delay: float = _RATE_LIMIT_BASE_DELAY,
-    jitter_factor: float = _RATE_LIMIT_JITTER_FACTOR,
+    min_delay_fraction: float = _RATE_LIMIT_MIN_DELAY_FRACTION,
+    max_delay: float = _RATE_LIMIT_MAX_TOTAL_DELAY,
 ) -> float:
     """
-    Calculate delay for a retry attempt with exponential backoff and jitter.
+    Calculate delay for a retry attempt with exponential backoff and full jitter.
+
+    The delay is drawn uniformly from [cap * min_delay_fraction, cap], where cap
+    is base_delay * 2^attempt (bounded by max_delay). Spreading
+    retries over the whole window, rather than a narrow band around the cap,
+    keeps xdist workers that hit the rate limit together from retrying in
+    lockstep and colliding again.
 
     Args:
         attempt: The retry attempt number (0-indexed)
         base_delay: Base delay in seconds
-        jitter_factor: Jitter factor (0.25 means +/- 25%)
+        min_delay_fraction: Lower bound of the delay as a fraction of the cap
+            (0.0 means full jitter, 1.0 means no jitter)
+        max_delay: Upper bound on the cap, so late attempts don't back off
+            longer than the caller can usefully wait
 
     Returns:
         Delay in seconds with jitter applied
     """
-    # Exponential backoff: base_delay * 2^attempt
-    delay = base_delay * (2**attempt)
-
-    # Apply jitter: delay * (1 +/- jitter_factor)
-    jitter = delay * jitter_factor * (2 * random.random() - 1)
-    return delay + jitter
+    cap = min(base_delay * (2**attempt), max_delay)
+    return _retry_rng.uniform(cap * min_delay_fraction, cap)
 
 
 def _is_rate_limit_error(exc: Exception) -> bool:
@@ -122,21 +161,25 @@ def _is_rate_limit_error(exc: Exception) -> bool:
     Returns:
         True if this is a rate limit error, False otherwise
     """
-    # Check NeonAPIError first - it inherits from HTTPError but doesn't have
-    # a response object, so we need to check the error text
+    import requests
+    from neon_api.exceptions import NeonAPIError
+
+    if not isinstance(exc, requests.HTTPError):
+        return False
+    # The status code is authoritative whenever a response is attached
+    response = exc.response
+    if response is not None:
+        return response.status_code == 429
+    # NeonAPIError (an HTTPError subclass) doesn't preserve the response
+    # object, only the text, so check for rate limit indicators in the message
     if isinstance(exc, NeonAPIError):
-        # NeonAPIError doesn't preserve the response object, only the text
-        # Check for rate limit indicators in the error message
+        error_text = str(exc)
+        if "429" in error_text:
+            return True
         # Note: We use "too many requests" specifically to avoid false positives
         # from errors like "too many connections" or "too many rows"
-        error_text = str(exc).lower()
-        return (
-            "429" in error_text
-            or "rate limit" in error_text
-            or "too many requests" in error_text
-        )
-    if isinstance(exc, requests.HTTPError):
-        return exc.response is not None and exc.response.status_code == 429
+        error_text = error_text.casefold()
+        return any(marker in error_text for marker in _RATE_LIMIT_ERROR_MARKERS)
     return False
 
 
@@ -144,45 +187,93 @@ def _get_retry_after_from_error(exc: Exception) -> float | None:
     """
     Extract Retry-After header value from an exception if available.
 
+    Accepts both forms allowed by RFC 9110: delta-seconds ("120") and an
+    HTTP-date ("Wed, 21 Oct 2015 07:28:00 GMT"), which is converted to the
+    number of seconds from now (0 if already in the past).
+
     Args:
         exc: The exception to check
 
     Returns:
         The Retry-After value in seconds, or None if not available
     """
-    if isinstance(exc, requests.HTTPError) and exc.response is not None:
-        retry_after = exc.response.headers.get("Retry-After")
+    import requests
+
+    response = getattr(exc, "response", None)
+    if isinstance(exc, requests.HTTPError) and response is not None:
+        retry_after = response.headers.get("Retry-After")
         if retry_after:
             try:
                 return float(retry_after)
             except ValueError:
                 pass
+            from email.utils import parsedate_to_datetime
+
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                # RFC 9110 HTTP-dates are always UTC
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
     return None
 
 
+class _RetryBudget:
+    """
+    Total rate-limit backoff allowed across one or more API calls.
+
+    Passing the same budget to every call in a multi-step operation (like
+    branch creation) caps the combined backoff, instead of letting each step
+    wait up to the full max_total_delay on its own. Thread-safe, since
+    branch creation makes some of its calls concurrently.
+    """
+
+    def __init__(self, max_total_delay: float = _RATE_LIMIT_MAX_TOTAL_DELAY):
+        self.max_total_delay = max_total_delay
+        self.total_delay = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, delay: float) -> bool:
+        """Reserve delay seconds from the budget. Returns False if exhausted."""
+        with self._lock:
+            if self.total_delay + delay > self.max_total_delay:
+                return False
+            self.total_delay += delay
+            return True
+
+
 def _retry_on_rate_limit(
     operation: Callable[[], T],
     operation_name: str,
     base_delay: float = _RATE_LIMIT_BASE_DELAY,
     max_total_delay: float = _RATE_LIMIT_MAX_TOTAL_DELAY,
-    jitter_factor: float = _RATE_LIMIT_JITTER_FACTOR,
+    min_delay_fraction: float = _RATE_LIMIT_MIN_DELAY_FRACTION,
     max_attempts: int = _RATE_LIMIT_MAX_ATTEMPTS,
+    max_delay: float = _RATE_LIMIT_MAX_TOTAL_DELAY,
+    budget: _RetryBudget | None = None,
 ) -> T:
     """
     Execute an operation with retry logic for rate limit (429) errors.
 
-    Uses exponential backoff with jitter. Retries until the operation succeeds,
+    Uses exponential backoff with full jitter. Retries until the operation succeeds,
     the total delay exceeds max_total_delay, or max_attempts is reached.
 
     See: https://api-docs.neon.tech/reference/api-rate-limiting
 
     Args:
-        operation: Callable that may raise requests.HTTPError or NeonAPIError
+        operation: Zero-argument callable that may raise requests.HTTPError or
+            NeonAPIError; bind API arguments with functools.partial
         operation_name: Human-readable name for error messages
         base_delay: Base delay in seconds for first retry
         max_total_delay: Maximum total delay across all retries
-        jitter_factor: Jitter factor for randomization
+        min_delay_fraction: Lower bound of each delay as a fraction of its cap
         max_attempts: Maximum number of retry attempts
+        max_delay: Maximum backoff for a single retry (not applied to
+            Retry-After, which the server asked for explicitly)
+        budget: Shared budget to draw delays from. If given, its limit is used
+            instead of max_total_delay.
 
     Returns:
         The result of the operation
@@ -193,13 +284,16 @@ def _retry_on_rate_limit(
         NeonAPIError: For non-429 API errors
         Exception: For other errors from the operation
     """
-    total_delay = 0.0
+    import requests
+
+    if budget is None:
+        budget = _RetryBudget(max_total_delay)
     attempt = 0
 
     while True:
         try:
             return operation()
-        except (requests.HTTPError, NeonAPIError) as e:
+        except requests.HTTPError as e:  # Includes NeonAPIError (a subclass)
             if _is_rate_limit_error(e):
                 # Check for Retry-After header (may be added by Neon in future)
                 retry_after = _get_retry_after_from_error(e)
@@ -207,29 +301,30 @@ def _retry_on_rate_limit(
                     # Ensure minimum delay to prevent infinite loops if Retry-After is 0
                     delay = max(retry_after, 0.1)
                 else:
-                    delay = _calculate_retry_delay(attempt, base_delay, jitter_factor)
+                    delay = _calculate_retry_delay(
+                        attempt, base_delay, min_delay_fraction, max_delay
+                    )
 
-                # Check if we've exceeded max total delay
-                if total_delay + delay > max_total_delay:
+                # Check if we've exceeded max attempts
+                attempt += 1
+                if attempt >= max_attempts:
                     raise NeonRateLimitError(
                         f"Rate limit exceeded for {operation_name}. "
-                        f"Max total delay ({max_total_delay:.1f}s) reached after "
-                        f"{attempt + 1} attempts. "
+                        f"Max attempts ({max_attempts}) reached after "
+                        f"{budget.total_delay:.1f}s total delay. "
                         f"See: https://api-docs.neon.tech/reference/api-rate-limiting"
                     ) from e
 
-                # Check if we've exceeded max attempts
-                attempt += 1
-                if attempt >= max_attempts:
+                # Check if we've exceeded max total delay
+                if not budget.reserve(delay):
                     raise NeonRateLimitError(
                         f"Rate limit exceeded for {operation_name}. "
-                        f"Max attempts ({max_attempts}) reached after "
-                        f"{total_delay:.1f}s total delay. "
+                        f"Max total delay ({budget.max_total_delay:.1f}s) reached "
+                        f"after {attempt} attempts. "
                         f"See: https://api-docs.neon.tech/reference/api-rate-limiting"
                     ) from e
 
                 time.sleep(delay)
-                total_delay += delay
             else:
                 # Non-429 error, re-raise immediately
                 raise
@@ -246,6 +341,10 @@ def _get_xdist_worker_id() -> str:
     return os.environ.get("PYTEST_XDIST_WORKER", "main")
 
 
+_BRANCH_NAME_DISALLOWED_RE = re.compile(r"[^a-zA-Z0-9_-]")
+_MULTIPLE_HYPHENS_RE = re.compile(r"-+")
+
+
 def _sanitize_branch_name(name: str) -> str:
     """
     Sanitize a string for use in Neon branch names.
@@ -253,12 +352,10 @@ def _sanitize_branch_name(name: str) -> str:
     Only allows alphanumeric characters, hyphens, and underscores.
     All other characters (including non-ASCII) are replaced with hyphens.
     """
-    import re
-
     # Replace anything that's not alphanumeric, hyphen, or underscore with hyphen
-    sanitized = re.sub(r"[^a-zA-Z0-9_-]", "-", name)
+    sanitized = _BRANCH_NAME_DISALLOWED_RE.sub("-", name)
     # Collapse multiple hyphens into one
-    sanitized = re.sub(r"-+", "-", sanitized)
+    sanitized = _MULTIPLE_HYPHENS_RE.sub("-", sanitized)
     # Remove leading/trailing hyphens
     sanitized = sanitized.strip("-")
     return sanitized
@@ -273,11 +370,10 @@ def _get_git_branch_name() -> str | None:
 
     The branch name is sanitized to replace special characters with hyphens.
     """
-    import subprocess
-
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             timeout=5,
@@ -290,6 +386,26 @@ def _get_git_branch_name() -> str | None:
     return None
 
 
+# Shared HTTP session for Neon API calls made outside of NeonAPI, so repeated
+# requests (including rate-limit retries) reuse a keep-alive connection
+# instead of paying a new TCP+TLS handshake each time.
+_http_session: requests.Session | None = None
+
+
+def _get_http_session() -> requests.Session:
+    """Get the shared HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        session.mount("https://", adapter)
+        _http_session = session
+    return _http_session
+
+
 def _reveal_role_password(
     api_key: str, project_id: str, branch_id: str, role_name: str
 ) -> str:
@@ -310,7 +426,10 @@ def _reveal_role_password(
         "Accept": "application/json",
     }
 
-    response = requests.get(url, headers=headers, timeout=30)
+    import requests
+    from neon_api.exceptions import NeonAPIError
+
+    response = _get_http_session().get(url, headers=headers, timeout=30)
     try:
         response.raise_for_status()
     except requests.exceptions.HTTPError:
@@ -321,7 +440,7 @@ def _reveal_role_password(
     return data["password"]
 
 
-@dataclass
+@dataclass(frozen=True)
 class NeonBranch:
     """Information about a Neon test branch."""
 
@@ -345,6 +464,9 @@ class NeonConfig:
     keep_branches: bool
     branch_expiry: int
     env_var_name: str
+    # Read only from NEON_ROLE_PASSWORD, so the secret never has to be put on
+    # the command line or committed to an ini file
+    role_password: str | None = None
 
     @classmethod
     def from_pytest_config(cls, config: pytest.Config) -> NeonConfig | None:
@@ -395,9 +517,14 @@ class NeonConfig:
             keep_branches=bool(keep_branches),
             branch_expiry=branch_expiry or DEFAULT_BRANCH_EXPIRY_SECONDS,
             env_var_name=env_var_name or "DATABASE_URL",
+            role_password=os.environ.get("NEON_ROLE_PASSWORD") or None,
         )
 
 
+# Resolved NeonConfig for a pytest run (None when required settings are missing)
+_NEON_CONFIG_KEY = pytest.StashKey["NeonConfig | None"]()
+
+
 class NeonBranchManager:
     """
     Manages Neon branch lifecycle operations.
@@ -407,10 +534,13 @@ class NeonBranchManager:
     """
 
     def __init__(self, config: NeonConfig):
+        from neon_api import NeonAPI
+
         self.config = config
         self._neon = NeonAPI(api_key=config.api_key)
         self._default_branch_id: str | None = None
         self._default_branch_id_fetched = False
+        self._branch_name_prefix: str | None = None
 
     def get_default_branch_id(self) -> str | None:
         """Get the default/primary branch ID (cached)."""
@@ -421,6 +551,22 @@ class NeonBranchManager:
             self._default_branch_id_fetched = True
         return self._default_branch_id
 
+    def get_branch_name_prefix(self) -> str:
+        """
+        Get the static prefix for branch names (cached).
+
+        Includes the first 15 characters of the git branch when available,
+        e.g. "pytest-feature-my-bran". The git branch can't change mid-session,
+        so the git subprocess only runs once rather than for every branch.
+        """
+        if self._branch_name_prefix is None:
+            git_branch = _get_git_branch_name()
+            if git_branch:
+                self._branch_name_prefix = f"pytest-{git_branch[:15]}"
+            else:
+                self._branch_name_prefix = "pytest"
+        return self._branch_name_prefix
+
     def create_branch(
         self,
         name_suffix: str = "",
@@ -441,13 +587,8 @@ class NeonBranchManager:
         parent_id = parent_branch_id or self.config.parent_branch_id
 
         # Generate unique branch name
-        random_suffix = os.urandom(2).hex()
-        git_branch = _get_git_branch_name()
-        if git_branch:
-            git_prefix = git_branch[:15]
-            branch_name = f"pytest-{git_prefix}-{random_suffix}{name_suffix}"
-        else:
-            branch_name = f"pytest-{random_suffix}{name_suffix}"
+        random_suffix = secrets.token_hex(2)
+        branch_name = f"{self.get_branch_name_prefix()}-{random_suffix}{name_suffix}"
 
         # Build branch config
         branch_config: dict[str, Any] = {"name": branch_name}
@@ -457,30 +598,50 @@ class NeonBranchManager:
         # Set expiry if specified
         if expiry_seconds and expiry_seconds > 0:
             expires_at = datetime.now(timezone.utc) + timedelta(seconds=expiry_seconds)
-            branch_config["expires_at"] = expires_at.strftime("%Y-%m-%dT%H:%M:%SZ")
+            branch_config["expires_at"] = expires_at.isoformat(
+                timespec="seconds"
+            ).replace("+00:00", "Z")
+
+        # All API calls below share one rate-limit budget, so a 429 storm
+        # fails branch creation after max_total_delay overall rather than
+        # after max_total_delay per step
+        budget = _RetryBudget()
 
         # Create branch with read_write endpoint
         result = _retry_on_rate_limit(
-            lambda: self._neon.branch_create(
+            partial(
+                self._neon.branch_create,
                 project_id=self.config.project_id,
                 branch=branch_config,
                 endpoints=[{"type": "read_write"}],
             ),
-            operation_name="branch_create",
+            "branch_create",
+            budget=budget,
         )
 
         branch = result.branch
-        endpoint_id = None
-        for op in result.operations:
-            if op.endpoint_id:
-                endpoint_id = op.endpoint_id
-                break
+        endpoint_id = next(
+            (op.endpoint_id for op in result.operations if op.endpoint_id), None
+        )
 
         if not endpoint_id:
             raise RuntimeError(f"No endpoint created for branch {branch.id}")
 
-        # Wait for endpoint to be active
-        host = self._wait_for_endpoint(endpoint_id)
+        if self.config.role_password:
+            # Branches inherit their parent's role passwords, so a configured
+            # password is valid as-is and the reveal round-trip can be skipped
+            host = self._wait_for_endpoint(endpoint_id, budget=budget)
+            password = self.config.role_password
+        else:
+            # Fetch the role password while waiting for the endpoint to become
+            # active. The password lives on the branch (not the compute), so
+            # the two round-trips don't depend on each other and can overlap.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                password_future = executor.submit(
+                    self._get_role_password, branch.id, budget=budget
+                )
+                host = self._wait_for_endpoint(endpoint_id, budget=budget)
+                password = password_future.result()
 
         # Safety check: never operate on default branch
         default_branch_id = self.get_default_branch_id()
@@ -490,10 +651,7 @@ class NeonBranchManager:
                 f"{branch.id}. Please report this bug."
             )
 
-        # Get password
-        connection_string = self._get_password_and_build_connection_string(
-            branch.id, host
-        )
+        connection_string = self._build_connection_string(host, password)
 
         return NeonBranch(
             branch_id=branch.id,
@@ -510,56 +668,80 @@ class NeonBranchManager:
             return
         try:
             _retry_on_rate_limit(
-                lambda: self._neon.branch_delete(
-                    project_id=self.config.project_id, branch_id=branch_id
+                partial(
+                    self._neon.branch_delete,
+                    project_id=self.config.project_id,
+                    branch_id=branch_id,
                 ),
-                operation_name="branch_delete",
+                "branch_delete",
             )
         except Exception as e:
             msg = f"Failed to delete Neon branch {branch_id}: {e}"
             warnings.warn(msg, stacklevel=2)
 
-    def _wait_for_endpoint(self, endpoint_id: str, max_wait_seconds: float = 60) -> str:
-        """Wait for endpoint to become active and return its host."""
-        poll_interval = 0.5
-        waited = 0.0
+    def _wait_for_endpoint(
+        self,
+        endpoint_id: str,
+        max_wait_seconds: float = 60,
+        budget: _RetryBudget | None = None,
+    ) -> str:
+        """
+        Wait for endpoint to become active and return its host.
+
+        Polls with exponential backoff: endpoints are usually active within a
+        second or two, so early polls are frequent while slow starts don't
+        spend the API rate limit on a fixed-interval poll.
+        """
+        get_endpoint = partial(
+            self._neon.endpoint,
+            project_id=self.config.project_id,
+            endpoint_id=endpoint_id,
+        )
+        poll_interval = _ENDPOINT_POLL_INITIAL_INTERVAL
+        deadline = time.monotonic() + max_wait_seconds
 
         while True:
             endpoint_response = _retry_on_rate_limit(
-                lambda: self._neon.endpoint(
-                    project_id=self.config.project_id, endpoint_id=endpoint_id
-                ),
-                operation_name="endpoint_status",
+                get_endpoint,
+                "endpoint_status",
+                max_delay=_ENDPOINT_STATUS_MAX_RETRY_DELAY,
+                budget=budget,
             )
             endpoint = endpoint_response.endpoint
             state = endpoint.current_state
 
-            if state == EndpointState.active:
+            # Compare raw values so a plain string state (as returned when the
+            # schema is built without enum coercion) is recognized too
+            if getattr(state, "value", state) == _ENDPOINT_ACTIVE_STATE:
                 return endpoint.host
 
-            if waited >= max_wait_seconds:
+            if time.monotonic() >= deadline:
                 raise RuntimeError(
                     f"Timeout waiting for endpoint {endpoint_id} to become active "
                     f"(current state: {state})"
                 )
 
             time.sleep(poll_interval)
-            waited += poll_interval
+            poll_interval = min(poll_interval * 2, _ENDPOINT_POLL_MAX_INTERVAL)
 
-    def _get_password_and_build_connection_string(
-        self, branch_id: str, host: str
+    def _get_role_password(
+        self, branch_id: str, budget: _RetryBudget | None = None
     ) -> str:
-        """Get role password (without resetting) and build connection string."""
-        password = _retry_on_rate_limit(
-            lambda: _reveal_role_password(
+        """Get the role password for a branch (without resetting it)."""
+        return _retry_on_rate_limit(
+            partial(
+                _reveal_role_password,
                 api_key=self.config.api_key,
                 project_id=self.config.project_id,
                 branch_id=branch_id,
                 role_name=self.config.role_name,
             ),
-            operation_name="role_password_reveal",
+            "role_password_reveal",
+            budget=budget,
         )
 
+    def _build_connection_string(self, host: str, password: str) -> str:
+        """Build a connection string for the configured role and database."""
         return (
             f"postgresql://{self.config.role_name}:{password}@{host}/"
             f"{self.config.database_name}?sslmode=require"
@@ -578,6 +760,7 @@ class XdistCoordinator:
         self.worker_id = _get_xdist_worker_id()
         self.is_xdist = self.worker_id != "main"
         self._worker_count: int | None = None
+        self._held_signal_locks: dict[str, FileLock] = {}
 
         if self.is_xdist:
             root_tmp_dir = tmp_path_factory.getbasetemp().parent
@@ -622,41 +805,101 @@ class XdistCoordinator:
         cache_file = self._lock_dir / f"neon_{resource_name}.json"
         lock_file = self._lock_dir / f"neon_{resource_name}.lock"
 
+        # Fast path: once the resource exists, readers never touch the lock.
+        # The creator publishes the cache with an atomic rename, so a reader
+        # either sees no file or a complete one.
+        try:
+            return json.loads(cache_file.read_bytes()), False
+        except FileNotFoundError:
+            pass
+
+        from filelock import FileLock
+
         with FileLock(str(lock_file)):
             if cache_file.exists():
-                data = json.loads(cache_file.read_text())
+                data = json.loads(cache_file.read_bytes())
                 return data, False
             else:
                 data = create_fn()
-                cache_file.write_text(json.dumps(data))
+                tmp_file = cache_file.with_suffix(".tmp")
+                tmp_file.write_text(json.dumps(data))
+                os.replace(tmp_file, cache_file)
                 return data, True
 
+    def _signal_lock(self, signal_name: str) -> FileLock:
+        from filelock import FileLock
+
+        assert self._lock_dir is not None
+        return FileLock(str(self._lock_dir / f"neon_{signal_name}.lock"))
+
+    def hold_signal(self, signal_name: str) -> None:
+        """
+        Take the barrier lock for a signal this worker will send later.
+
+        Must be called before other workers can start waiting (i.e. before
+        the shared resource is published), so that wait_for_signal() blocks
+        until send_signal() or release_signal() is called.
+        """
+        if not self.is_xdist or self._lock_dir is None:
+            return
+        if signal_name in self._held_signal_locks:
+            return
+
+        lock = self._signal_lock(signal_name)
+        lock.acquire()
+        self._held_signal_locks[signal_name] = lock
+
+    def release_signal(self, signal_name: str) -> None:
+        """Release a held barrier lock without sending the signal."""
+        lock = self._held_signal_locks.pop(signal_name, None)
+        if lock is not None:
+            lock.release()
+
     def wait_for_signal(self, signal_name: str, timeout: float = 60) -> None:
-        """Wait for a signal file to be created by another worker."""
+        """
+        Wait for a signal to be sent by another worker.
+
+        Blocks on the signal's barrier lock, which the sending worker holds
+        until it sends the signal, so waiters resume as soon as the lock is
+        released. The lock is also released if the sender dies, in which case
+        this fails right away instead of waiting out the timeout.
+        """
+        from filelock import Timeout
+
         if not self.is_xdist or self._lock_dir is None:
             return
 
         signal_file = self._lock_dir / f"neon_{signal_name}"
-        waited = 0.0
-        poll_interval = 0.5
+        if signal_file.exists():
+            return
 
-        while not signal_file.exists():
-            if waited >= timeout:
-                raise RuntimeError(
-                    f"Worker {self.worker_id} timed out waiting for signal "
-                    f"'{signal_name}' after {timeout}s. This usually means the "
-                    f"creator worker failed or is still processing."
-                )
-            time.sleep(poll_interval)
-            waited += poll_interval
+        lock = self._signal_lock(signal_name)
+        try:
+            lock.acquire(timeout=timeout)
+        except Timeout:
+            raise RuntimeError(
+                f"Worker {self.worker_id} timed out waiting for signal "
+                f"'{signal_name}' after {timeout}s. This usually means the "
+                f"creator worker failed or is still processing."
+            ) from None
+        lock.release()
+
+        if not signal_file.exists():
+            raise RuntimeError(
+                f"Worker {self.worker_id} stopped waiting for signal "
+                f"'{signal_name}': the creator worker released it without "
+                f"sending it. This usually means the creator worker failed "
+                f"(for example, neon_apply_migrations raised an error)."
+            )
 
     def send_signal(self, signal_name: str) -> None:
-        """Create a signal file for other workers."""
+        """Create a signal file for other workers and release its barrier."""
         if not self.is_xdist or self._lock_dir is None:
             return
 
         signal_file = self._lock_dir / f"neon_{signal_name}"
         signal_file.write_text("done")
+        self.release_signal(signal_name)
 
     def signal_worker_done(self) -> None:
         """Signal that this worker has completed all tests."""
@@ -680,10 +923,12 @@ class XdistCoordinator:
             return
 
         worker_count = self._get_worker_count()
-        waited = 0.0
-        poll_interval = 0.5
+        # Workers usually finish close together, so poll quickly at first and
+        # back off if some are still running long tests
+        poll_interval = _WORKERS_DONE_POLL_INITIAL_INTERVAL
+        deadline = time.monotonic() + timeout
 
-        while waited < timeout:
+        while True:
             done_count = 0
             for i in range(worker_count):
                 done_file = self._lock_dir / f"neon_worker_done_gw{i}"
@@ -692,9 +937,11 @@ class XdistCoordinator:
 
             if done_count >= worker_count:
                 return
+            if time.monotonic() >= deadline:
+                break
 
             time.sleep(poll_interval)
-            waited += poll_interval
+            poll_interval = min(poll_interval * 1.5, _WORKERS_DONE_POLL_MAX_INTERVAL)
 
         # Timeout - log warning but proceed with cleanup anyway
         # This prevents infinite hangs if a worker crashes
@@ -757,8 +1004,7 @@ def _get_default_branch_id(neon: NeonAPI, project_id: str) -> str | None:
         # Wrap in retry logic to handle rate limits
         # See: https://api-docs.neon.tech/reference/api-rate-limiting
         response = _retry_on_rate_limit(
-            lambda: neon.branches(project_id=project_id),
-            operation_name="list_branches",
+            partial(neon.branches, project_id=project_id), "list_branches"
         )
         for branch in response.branches:
             # Check both 'default' and 'primary' flags for compatibility
@@ -816,6 +1062,16 @@ def pytest_addoption(parser: pytest.Parser) -> None:
             f"(default: {DEFAULT_BRANCH_EXPIRY_SECONDS}). Set to 0 to disable."
         ),
     )
+    group.addoption(
+        "--neon-eager-branch",
+        action="store_true",
+        default=None,
+        dest="neon_eager_branch",
+        help=(
+            "Start creating the test branch in the background at session start, "
+            "overlapping it with test collection (not used under xdist)"
+        ),
+    )
     group.addoption(
         "--neon-env-var",
         dest="neon_env_var",
@@ -844,6 +1100,90 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         "Environment variable for connection string",
         default="DATABASE_URL",
     )
+    parser.addini(
+        "neon_eager_branch",
+        "Start creating the test branch at session start",
+        type="bool",
+        default=False,
+    )
+
+
+# Branch creation started by pytest_sessionstart for --neon-eager-branch. It is
+# taken by _neon_test_branch, or cleaned up at session finish if no test used it.
+_EAGER_BRANCH_KEY: pytest.StashKey[Future[NeonBranch]] = pytest.StashKey()
+
+
+# Options under which pytest reports on tests or fixtures without setting up
+# any fixtures, so an eagerly created branch would only be created and deleted
+# again (--setup-only does set fixtures up, so it keeps eager creation)
+_NO_TEST_RUN_OPTIONS = (
+    "collectonly",
+    "showfixtures",
+    "show_fixtures_per_test",
+    "setupplan",
+)
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Start creating the test branch early when eager creation is enabled.
+
+    The branch API calls then overlap with collection instead of starting when
+    the first test needs the branch. Only done in single-process runs: under
+    xdist the branch is created by whichever worker wins the creator election.
+    """
+    config = session.config
+    eager = config.getoption("neon_eager_branch", default=None)
+    if eager is None:
+        eager = config.getini("neon_eager_branch")
+    if not eager or any(
+        config.getoption(option, default=False) for option in _NO_TEST_RUN_OPTIONS
+    ):
+        return
+    if _get_xdist_worker_id() != "main" or config.getoption(
+        "numprocesses", default=None
+    ):
+        return
+
+    neon_config = _get_neon_config(config)
+    if neon_config is None:
+        return
+
+    manager = _get_branch_manager(config, neon_config)
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(
+        manager.create_branch,
+        name_suffix="-test",
+        expiry_seconds=neon_config.branch_expiry,
+    )
+    executor.shutdown(wait=False)
+    config.stash[_EAGER_BRANCH_KEY] = future
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Delete an eagerly created branch that no test ended up using."""
+    future = session.config.stash.get(_EAGER_BRANCH_KEY, None)
+    if future is None:
+        return
+    del session.config.stash[_EAGER_BRANCH_KEY]
+
+    try:
+        branch = future.result()
+    except Exception:
+        # Nothing was created, and no test needed the branch anyway
+        return
+    session.config.stash[_NEON_BRANCH_MANAGER_KEY].delete_branch(branch.branch_id)
+
+
+def pytest_report_header(config: pytest.Config) -> str | None:
+    """Note in the session header when NEON_ROLE_PASSWORD is in use.
+
+    Branches then connect with that password instead of the one the Neon API
+    reports, so a stale value shows up as authentication failures.
+    """
+    neon_config = _get_neon_config(config)
+    if neon_config is None or not neon_config.role_password:
+        return None
+    return "pytest-neon: connecting with the role password from NEON_ROLE_PASSWORD"
 
 
 def _get_config_value(
@@ -879,7 +1219,9 @@ def _get_config_value(
 
 def _branch_to_dict(branch: NeonBranch) -> dict[str, Any]:
     """Convert NeonBranch to a JSON-serializable dict."""
-    return asdict(branch)
+    # NeonBranch only holds flat str/None fields, so a shallow copy is enough;
+    # asdict() would recursively deep-copy every value.
+    return {f.name: getattr(branch, f.name) for f in fields(branch)}
 
 
 def _dict_to_branch(data: dict[str, Any]) -> NeonBranch:
@@ -891,6 +1233,17 @@ def _dict_to_branch(data: dict[str, Any]) -> NeonBranch:
 _MIGRATION_WAIT_TIMEOUT = 300  # 5 minutes
 
 
+def _get_neon_config(config: pytest.Config) -> NeonConfig | None:
+    """Get the NeonConfig for this run, resolving options/env/ini only once.
+
+    The result is kept in the pytest config stash so that every caller in the
+    process (fixtures and hooks alike) shares a single lookup.
+    """
+    if _NEON_CONFIG_KEY not in config.stash:
+        config.stash[_NEON_CONFIG_KEY] = NeonConfig.from_pytest_config(config)
+    return config.stash[_NEON_CONFIG_KEY]
+
+
 @pytest.fixture(scope="session")
 def _neon_config(request: pytest.FixtureRequest) -> NeonConfig:
     """
@@ -898,7 +1251,7 @@ def _neon_config(request: pytest.FixtureRequest) -> NeonConfig:
 
     Skips tests if required configuration (api_key, project_id) is missing.
     """
-    config = NeonConfig.from_pytest_config(request.config)
+    config = _get_neon_config(request.config)
     if config is None:
         pytest.skip(
             "Neon configuration missing. Set NEON_API_KEY and NEON_PROJECT_ID "
@@ -907,10 +1260,26 @@ def _neon_config(request: pytest.FixtureRequest) -> NeonConfig:
     return config
 
 
+# NeonBranchManager for a pytest run, shared by the eager creation hooks and
+# the _neon_branch_manager fixture so a run has one API client
+_NEON_BRANCH_MANAGER_KEY = pytest.StashKey[NeonBranchManager]()
+
+
+def _get_branch_manager(
+    config: pytest.Config, neon_config: NeonConfig
+) -> NeonBranchManager:
+    """Get the NeonBranchManager for this run, creating it on first use."""
+    if _NEON_BRANCH_MANAGER_KEY not in config.stash:
+        config.stash[_NEON_BRANCH_MANAGER_KEY] = NeonBranchManager(neon_config)
+    return config.stash[_NEON_BRANCH_MANAGER_KEY]
+
+
 @pytest.fixture(scope="session")
-def _neon_branch_manager(_neon_config: NeonConfig) -> NeonBranchManager:
+def _neon_branch_manager(
+    request: pytest.FixtureRequest, _neon_config: NeonConfig
+) -> NeonBranchManager:
     """Session-scoped branch manager for Neon operations."""
-    return NeonBranchManager(_neon_config)
+    return _get_branch_manager(request.config, _neon_config)
 
 
 @pytest.fixture(scope="session")
@@ -923,6 +1292,7 @@ def _neon_xdist_coordinator(
 
 @pytest.fixture(scope="session")
 def _neon_test_branch(
+    request: pytest.FixtureRequest,
     _neon_config: NeonConfig,
     _neon_branch_manager: NeonBranchManager,
     _neon_xdist_coordinator: XdistCoordinator,
@@ -944,10 +1314,19 @@ def _neon_test_branch(
     env_manager = EnvironmentManager(_neon_config.env_var_name)
 
     def create_branch() -> dict[str, Any]:
-        b = _neon_branch_manager.create_branch(
-            name_suffix="-test",
-            expiry_seconds=_neon_config.branch_expiry,
-        )
+        eager = request.config.stash.get(_EAGER_BRANCH_KEY, None)
+        if eager is not None:
+            # Already being created since session start (--neon-eager-branch)
+            del request.config.stash[_EAGER_BRANCH_KEY]
+            b = eager.result()
+        else:
+            b = _neon_branch_manager.create_branch(
+                name_suffix="-test",
+                expiry_seconds=_neon_config.branch_expiry,
+            )
+        # Hold the migrations barrier before the branch is published, so any
+        # worker that can see the branch blocks until migrations are done
+        _neon_xdist_coordinator.hold_signal("migrations_done")
         return {"branch": _branch_to_dict(b)}
 
     data, is_creator = _neon_xdist_coordinator.coordinate_resource(
@@ -960,6 +1339,8 @@ def _neon_test_branch(
         yield branch, is_creator
     finally:
         env_manager.restore()
+        # Unblock waiting workers if migrations failed before the signal was sent
+        _neon_xdist_coordinator.release_signal("migrations_done")
         # Signal that this worker is done with all tests
         _neon_xdist_coordinator.signal_worker_done()
 
@@ -1044,6 +1425,11 @@ def neon_branch(
         - NEON_API_KEY and NEON_PROJECT_ID environment variables, or
         - --neon-api-key and --neon-project-id command line options
 
+    If NEON_ROLE_PASSWORD is set (and not empty), the connection string uses
+    that password rather than the one the Neon API reports for the role. The
+    session header says so, and the connection fixtures warn when a
+    connection is refused with it.
+
     Returns:
         NeonBranch: Object with branch_id, project_id, connection_string, and host.
 
@@ -1085,15 +1471,212 @@ def neon_branch(
     return branch
 
 
+# pytest.fail() messages for convenience fixtures whose optional driver is missing
+_PSYCOPG2_MISSING_MSG = (
+    "\n\n"
+    "═══════════════════════════════════════════════════════════════════\n"
+    "  MISSING DEPENDENCY: psycopg2\n"
+    "═══════════════════════════════════════════════════════════════════\n\n"
+    "  The 'neon_connection' fixture requires psycopg2.\n\n"
+    "  To fix this, install the psycopg2 extra:\n\n"
+    "      pip install pytest-neon[psycopg2]\n\n"
+    "  Or use the 'neon_branch' fixture with your own driver:\n\n"
+    "      def test_example(neon_branch):\n"
+    "          import your_driver\n"
+    "          conn = your_driver.connect(\n"
+    "              neon_branch.connection_string)\n\n"
+    "═══════════════════════════════════════════════════════════════════\n"
+)
+
+_PSYCOPG_MISSING_MSG = (
+    "\n\n"
+    "═══════════════════════════════════════════════════════════════════\n"
+    "  MISSING DEPENDENCY: psycopg (v3)\n"
+    "═══════════════════════════════════════════════════════════════════\n\n"
+    "  The 'neon_connection_psycopg' fixture requires psycopg v3.\n\n"
+    "  To fix this, install the psycopg extra:\n\n"
+    "      pip install pytest-neon[psycopg]\n\n"
+    "  Or use the 'neon_branch' fixture with your own driver:\n\n"
+    "      def test_example(neon_branch):\n"
+    "          import your_driver\n"
+    "          conn = your_driver.connect(\n"
+    "              neon_branch.connection_string)\n\n"
+    "═══════════════════════════════════════════════════════════════════\n"
+)
+
+_SQLALCHEMY_MISSING_MSG = (
+    "\n\n"
+    "═══════════════════════════════════════════════════════════════════\n"
+    "  MISSING DEPENDENCY: SQLAlchemy\n"
+    "═══════════════════════════════════════════════════════════════════\n\n"
+    "  The 'neon_engine' fixture requires SQLAlchemy.\n\n"
+    "  To fix this, install the sqlalchemy extra:\n\n"
+    "      pip install pytest-neon[sqlalchemy]\n\n"
+    "  Or use the 'neon_branch' fixture with your own driver:\n\n"
+    "      def test_example(neon_branch):\n"
+    "          from sqlalchemy import create_engine\n"
+    "          engine = create_engine(\n"
+    "              neon_branch.connection_string)\n\n"
+    "═══════════════════════════════════════════════════════════════════\n"
+)
+
+# Optional driver modules imported so far in this run, by module name (None
+# when the module is not installed)
+_OPTIONAL_MODULES_KEY = pytest.StashKey["dict[str, Any]"]()
+
+
+def _import_optional(config: pytest.Config, module_name: str) -> Any:
+    """Import an optional dependency once per run; None if it is not installed.
+
+    The result is cached in the config stash, so fixtures can look a driver up
+    repeatedly without re-running the import machinery or its failure path.
+    """
+    modules = config.stash.setdefault(_OPTIONAL_MODULES_KEY, {})
+    if module_name not in modules:
+        try:
+            modules[module_name] = importlib.import_module(module_name)
+        except ImportError:
+            modules[module_name] = None
+    return modules[module_name]
+
+
+# Missing-dependency message for each optional driver module
+_MISSING_DEPENDENCY_MESSAGES = {
+    "psycopg2": _PSYCOPG2_MISSING_MSG,
+    "psycopg": _PSYCOPG_MISSING_MSG,
+    "sqlalchemy": _SQLALCHEMY_MISSING_MSG,
+}
+
+
+def _require_optional(config: pytest.Config, module_name: str) -> Any:
+    """Import an optional driver, or fail with instructions to install it."""
+    module = _import_optional(config, module_name)
+    if module is None:
+        pytest.fail(_MISSING_DEPENDENCY_MESSAGES[module_name])
+    return module
+
+
+# Text of the server error for a wrong password, as psycopg2, psycopg and
+# SQLAlchemy all report it
+_AUTH_FAILED_MESSAGE = "password authentication failed"
+
+
+@contextlib.contextmanager
+def _role_password_hint(config: pytest.Config) -> Generator[None, None, None]:
+    """Warn when a connection fails with the password from NEON_ROLE_PASSWORD."""
+    try:
+        yield
+    except Exception as e:
+        neon_config = _get_neon_config(config)
+        if (
+            neon_config is not None
+            and neon_config.role_password
+            and _AUTH_FAILED_MESSAGE in str(e)
+        ):
+            warnings.warn(
+                f"Connecting to the Neon branch as {neon_config.role_name} "
+                f"failed with the password from NEON_ROLE_PASSWORD. Update it "
+                f"or unset it to have the password looked up through the Neon "
+                f"API.",
+                stacklevel=3,
+            )
+        raise
+
+
+# Upper bound on psycopg2 connections open at once in the neon_connection pool
+_PSYCOPG2_POOL_MAXCONN = 8
+
+
+@pytest.fixture(scope="session")
+def _neon_psycopg2_pool(
+    request: pytest.FixtureRequest, neon_branch: NeonBranch
+) -> Generator[Any, None, None]:
+    """
+    Session-scoped psycopg2 connection pool for the test branch.
+
+    Backs the neon_connection fixture, so each test borrows an open connection
+    instead of paying a TCP+TLS+auth handshake to the Neon endpoint.
+    """
+    _require_optional(request.config, "psycopg2")
+
+    from psycopg2.pool import ThreadedConnectionPool
+
+    with _role_password_hint(request.config):
+        pool = ThreadedConnectionPool(
+            minconn=1,
+            maxconn=_PSYCOPG2_POOL_MAXCONN,
+            dsn=neon_branch.connection_string,
+        )
+    yield pool
+    pool.closeall()
+
+
+def _psycopg2_client_state(conn: Any) -> tuple[Any, ...]:
+    """Client-side state of a psycopg2 connection that can't be put back.
+
+    Taken when a connection is handed to a test and compared when it comes
+    back, before anything is sent to the server. A connection's first checkout
+    is right after it was opened, and every later one starts from a state that
+    matched, so this is the state the connection had when it was opened.
+    """
+    return (dict(conn.string_types), dict(conn.binary_types), conn.encoding)
+
+
+def _discard_psycopg2_session(conn: Any) -> None:
+    """Reset the server session of an idle psycopg2 connection with DISCARD ALL.
+
+    Besides RESET ALL, DISCARD ALL drops temp tables, releases advisory locks,
+    runs UNLISTEN * and deallocates prepared statements. It can't run inside a
+    transaction block, so it is sent in autocommit mode.
+    """
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute("DISCARD ALL")
+    conn.autocommit = False
+
+
+def _getconn_clean(pool: Any) -> Any:
+    """Take a connection from the pool and reset its server session.
+
+    The DISCARD ALL doubles as the liveness check, so a connection the server
+    dropped while idle (idle timeout, compute restart) costs no extra round
+    trip to detect. A dead connection is closed and the checkout retried once.
+    """
+    import psycopg2
+
+    conn = pool.getconn()
+    try:
+        _discard_psycopg2_session(conn)
+    except psycopg2.Error:
+        # Only one test holds a connection at a time, so the pool has no other
+        # idle connection and this opens a fresh one
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
+        try:
+            _discard_psycopg2_session(conn)
+        except psycopg2.Error:
+            pool.putconn(conn, close=True)
+            raise
+    return conn
+
+
 @pytest.fixture
-def neon_connection(neon_branch: NeonBranch):
+def neon_connection(_neon_psycopg2_pool: Any):
     """
     Provide a psycopg2 connection to the test branch.
 
     Requires the psycopg2 optional dependency:
         pip install pytest-neon[psycopg2]
 
-    The connection is rolled back and closed after each test.
+    Connections come from a session-wide pool. Each one is cleaned with
+    DISCARD ALL as it is handed to a test, which resets session settings,
+    drops temp tables, releases advisory locks, stops LISTENing and
+    deallocates prepared statements; a connection the server dropped fails
+    that command and is replaced. After each test the connection is rolled
+    back and its cursor_factory restored. If the test changed client state
+    that can't be restored (e.g. registered a typecaster or changed the
+    client encoding), the connection is closed instead of reused. Committed
+    data persists.
 
     Yields:
         psycopg2 connection object
@@ -1104,40 +1687,133 @@ def neon_connection(neon_branch: NeonBranch):
             cur.execute("INSERT INTO users (name) VALUES ('test')")
             neon_connection.commit()
     """
+    import psycopg2
+
+    conn = _getconn_clean(_neon_psycopg2_pool)
+    cursor_factory = conn.cursor_factory
+    opened_state = _psycopg2_client_state(conn)
     try:
-        import psycopg2
-    except ImportError:
-        pytest.fail(
-            "\n\n"
-            "═══════════════════════════════════════════════════════════════════\n"
-            "  MISSING DEPENDENCY: psycopg2\n"
-            "═══════════════════════════════════════════════════════════════════\n\n"
-            "  The 'neon_connection' fixture requires psycopg2.\n\n"
-            "  To fix this, install the psycopg2 extra:\n\n"
-            "      pip install pytest-neon[psycopg2]\n\n"
-            "  Or use the 'neon_branch' fixture with your own driver:\n\n"
-            "      def test_example(neon_branch):\n"
-            "          import your_driver\n"
-            "          conn = your_driver.connect(\n"
-            "              neon_branch.connection_string)\n\n"
-            "═══════════════════════════════════════════════════════════════════\n"
-        )
+        yield conn
+    finally:
+        broken = bool(conn.closed) or _psycopg2_client_state(conn) != opened_state
+        if not broken:
+            conn.cursor_factory = cursor_factory
+            try:
+                conn.rollback()
+                # Client-side only: psycopg2 applies these with the next BEGIN
+                conn.set_session(
+                    isolation_level="DEFAULT",
+                    readonly="DEFAULT",
+                    deferrable="DEFAULT",
+                    autocommit=False,
+                )
+            except psycopg2.Error:
+                broken = True
+            del conn.notices[:]
+            del conn.notifies[:]
+        _neon_psycopg2_pool.putconn(conn, close=broken)
+
+
+@pytest.fixture(scope="session")
+def _neon_psycopg_connections(
+    request: pytest.FixtureRequest,
+) -> Generator[list[Any], None, None]:
+    """
+    Session-scoped idle psycopg connections backing neon_connection_psycopg.
 
-    conn = psycopg2.connect(neon_branch.connection_string)
-    yield conn
+    Connections are handed back here after each test and reused by the next
+    one, so the suite pays one TCP+TLS+auth handshake instead of one per test.
+    """
+    _require_optional(request.config, "psycopg")
+
+    idle: list[Any] = []
+    yield idle
+    for conn in idle:
+        conn.close()
+
+
+# Client-side psycopg connection attributes a test may set, restored after it
+_PSYCOPG_RESTORABLE_ATTRS = (
+    "row_factory",
+    "cursor_factory",
+    "server_cursor_factory",
+    "prepare_threshold",
+    "prepared_max",
+)
+
+# psycopg connection methods registering callbacks that its public API can't
+# list or undo in bulk; a connection a test called one on is closed after it
+_PSYCOPG_HANDLER_METHODS = ("add_notice_handler", "add_notify_handler")
+
+
+def _record_calls(method: Callable[..., Any], calls: list[str]) -> Callable[..., Any]:
+    """Wrap a bound method so that each call is recorded by name."""
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        calls.append(method.__name__)
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+def _psycopg_is_alive(conn: Any) -> bool:
+    """Check that the server hasn't dropped an idle psycopg connection."""
+    import psycopg
+
+    try:
+        conn.execute("SELECT 1")
+        conn.rollback()
+    except psycopg.Error:
+        return False
+    return True
+
+
+def _reset_psycopg_connection(conn: Any, restorable: dict[str, Any]) -> None:
+    """Return a psycopg connection to its freshly-opened state."""
+    for name, value in restorable.items():
+        setattr(conn, name, value)
     conn.rollback()
-    conn.close()
+    # DISCARD ALL can't run inside a transaction block. Besides RESET ALL it
+    # drops temp tables, releases advisory locks, runs UNLISTEN * and
+    # deallocates prepared statements (psycopg clears its own cache of them
+    # when it sees the command).
+    conn.autocommit = True
+    conn.execute("DISCARD ALL")
+    conn.autocommit = False
+    conn.isolation_level = None
+    conn.read_only = None
+    conn.deferrable = None
+    # Drain notifications received before the UNLISTEN, so the next test's
+    # notifies() doesn't report them. This only polls the socket.
+    try:
+        backlog = conn.notifies(timeout=0)
+    except TypeError:
+        return  # psycopg < 3.2 keeps no backlog of notifications
+    for _ in backlog:
+        pass
 
 
 @pytest.fixture
-def neon_connection_psycopg(neon_branch: NeonBranch):
+def neon_connection_psycopg(
+    request: pytest.FixtureRequest,
+    neon_branch: NeonBranch,
+    _neon_psycopg_connections: list[Any],
+) -> Generator[Any, None, None]:
     """
     Provide a psycopg (v3) connection to the test branch.
 
     Requires the psycopg optional dependency:
         pip install pytest-neon[psycopg]
 
-    The connection is rolled back and closed after each test.
+    Connections are reused across tests and checked with a cheap query before
+    each one, so a connection dropped by the server is replaced. After each
+    test the connection is rolled back and cleaned with DISCARD ALL, which
+    resets session settings, drops temp tables, releases advisory locks, stops
+    LISTENing and deallocates prepared statements. Client-side settings such
+    as row_factory and prepare_threshold are restored, and adapters the test
+    registers on the connection are dropped. If the test added a notice or
+    notify handler, the connection is closed instead of reused. Committed
+    data persists.
 
     Yields:
         psycopg connection object
@@ -1148,42 +1824,84 @@ def neon_connection_psycopg(neon_branch: NeonBranch):
                 cur.execute("INSERT INTO users (name) VALUES ('test')")
             neon_connection_psycopg.commit()
     """
+    import psycopg
+    from psycopg.adapt import AdaptersMap
+
+    idle = _neon_psycopg_connections
+    conn = None
+    while idle:
+        candidate = idle.pop()
+        if _psycopg_is_alive(candidate):
+            conn = candidate
+            break
+        candidate.close()
+    if conn is None:
+        with _role_password_hint(request.config):
+            conn = psycopg.connect(neon_branch.connection_string)
+
+    # Reused connections were restored to these values, so this is the state
+    # the connection had when it was opened
+    restorable = {name: getattr(conn, name) for name in _PSYCOPG_RESTORABLE_ATTRS}
+    # Adapters the test registers go into a layer over the connection's own,
+    # which is dropped afterwards. psycopg has no public setter for this, so
+    # if the swap doesn't take, the connection is not reused.
+    adapters = conn.adapters
+    conn._adapters = AdaptersMap(adapters)
+    adapters_isolated = conn.adapters is not adapters
+    handler_calls: list[str] = []
+    for name in _PSYCOPG_HANDLER_METHODS:
+        setattr(conn, name, _record_calls(getattr(conn, name), handler_calls))
     try:
-        import psycopg
-    except ImportError:
-        pytest.fail(
-            "\n\n"
-            "═══════════════════════════════════════════════════════════════════\n"
-            "  MISSING DEPENDENCY: psycopg (v3)\n"
-            "═══════════════════════════════════════════════════════════════════\n\n"
-            "  The 'neon_connection_psycopg' fixture requires psycopg v3.\n\n"
-            "  To fix this, install the psycopg extra:\n\n"
-            "      pip install pytest-neon[psycopg]\n\n"
-            "  Or use the 'neon_branch' fixture with your own driver:\n\n"
-            "      def test_example(neon_branch):\n"
-            "          import your_driver\n"
-            "          conn = your_driver.connect(\n"
-            "              neon_branch.connection_string)\n\n"
-            "═══════════════════════════════════════════════════════════════════\n"
-        )
+        yield conn
+    finally:
+        for name in _PSYCOPG_HANDLER_METHODS:
+            delattr(conn, name)
+        conn._adapters = adapters
+        reusable = adapters_isolated and not handler_calls and not conn.closed
+        if reusable:
+            try:
+                _reset_psycopg_connection(conn, restorable)
+            except psycopg.Error:
+                reusable = False
+        if reusable:
+            idle.append(conn)
+        else:
+            conn.close()
 
-    conn = psycopg.connect(neon_branch.connection_string)
-    yield conn
-    conn.rollback()
-    conn.close()
+
+@pytest.fixture(scope="session")
+def _neon_engine(
+    request: pytest.FixtureRequest, neon_branch: NeonBranch
+) -> Generator[Any, None, None]:
+    """
+    Session-scoped SQLAlchemy engine for the test branch.
+
+    Backs neon_engine and neon_engine_connection, so the connection pool is
+    reused across the session instead of reconnecting for every test. Pooled
+    connections are pinged before use.
+    """
+    sqlalchemy = _require_optional(request.config, "sqlalchemy")
+
+    engine = sqlalchemy.create_engine(neon_branch.connection_string, pool_pre_ping=True)
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
-def neon_engine(neon_branch: NeonBranch):
+def neon_engine(_neon_engine: Any) -> Any:
     """
     Provide a SQLAlchemy engine connected to the test branch.
 
     Requires the sqlalchemy optional dependency:
         pip install pytest-neon[sqlalchemy]
 
-    The engine is disposed after each test.
+    Each test gets its own engine object sharing a session-wide connection
+    pool, so tests don't reconnect to the branch. Connection and execution
+    event listeners added in a test stay with that test's engine, and
+    dispose() only closes the pooled connections. Pool events (such as
+    "connect") are registered on the shared pool.
 
-    Yields:
+    Returns:
         SQLAlchemy Engine object
 
     Example::
@@ -1192,25 +1910,59 @@ def neon_engine(neon_branch: NeonBranch):
             with neon_engine.connect() as conn:
                 result = conn.execute(text("SELECT 1"))
     """
-    try:
-        from sqlalchemy import create_engine
-    except ImportError:
-        pytest.fail(
-            "\n\n"
-            "═══════════════════════════════════════════════════════════════════\n"
-            "  MISSING DEPENDENCY: SQLAlchemy\n"
-            "═══════════════════════════════════════════════════════════════════\n\n"
-            "  The 'neon_engine' fixture requires SQLAlchemy.\n\n"
-            "  To fix this, install the sqlalchemy extra:\n\n"
-            "      pip install pytest-neon[sqlalchemy]\n\n"
-            "  Or use the 'neon_branch' fixture with your own driver:\n\n"
-            "      def test_example(neon_branch):\n"
-            "          from sqlalchemy import create_engine\n"
-            "          engine = create_engine(\n"
-            "              neon_branch.connection_string)\n\n"
-            "═══════════════════════════════════════════════════════════════════\n"
-        )
+    # An option engine shares the pool but has its own event dispatch
+    return _neon_engine.execution_options()
 
-    engine = create_engine(neon_branch.connection_string)
-    yield engine
-    engine.dispose()
+
+def _reject_commit(conn: Any) -> None:
+    raise RuntimeError(
+        "neon_engine_connection is rolled back after each test, so it can't be "
+        "committed. Use begin_nested() for savepoints within a test, or "
+        "neon_engine for data that should persist."
+    )
+
+
+@pytest.fixture
+def neon_engine_connection(
+    request: pytest.FixtureRequest, _neon_engine: Any
+) -> Generator[Any, None, None]:
+    """
+    Provide a SQLAlchemy connection inside a transaction that is rolled back.
+
+    Requires the sqlalchemy optional dependency:
+        pip install pytest-neon[sqlalchemy]
+
+    The connection comes from the session-wide engine pool. Everything the
+    test does is rolled back afterwards, so tests don't see each other's
+    writes. commit() raises RuntimeError rather than persisting data to the
+    shared branch; use begin_nested() for savepoints within a test. A
+    Session bound to the connection joins its transaction, so
+    Session.commit() does not persist data either.
+
+    Yields:
+        SQLAlchemy Connection object
+
+    Example::
+
+        def test_insert(neon_engine_connection):
+            neon_engine_connection.execute(
+                text("INSERT INTO users (name) VALUES ('test')")
+            )
+            # Rolled back after the test
+    """
+    from sqlalchemy import event
+
+    with _role_password_hint(request.config):
+        conn = _neon_engine.connect()
+    trans = conn.begin()
+    event.listen(conn, "commit", _reject_commit)
+    try:
+        yield conn
+    finally:
+        if trans.is_active:
+            trans.rollback()
+        else:
+            # A rejected commit() ends the SQLAlchemy transaction but leaves the
+            # database transaction open, and the pool skips its reset-on-return
+            conn.connection.rollback()
+        conn.close()
@@ -16,3 +16,112 @@ class TestCliOptionPassing:
 
         result = pytester.runpytest("-v", "--neon-keep-branches")
         result.assert_outcomes(passed=1)
+
+
+class TestNeonConfigResolution:
+    """Test that the Neon configuration is resolved once per run."""
+
+    def test_config_resolved_once(self, pytester, monkeypatch):
+        """Repeated lookups return the same cached NeonConfig."""
+        monkeypatch.setenv("NEON_API_KEY", "test-key")
+        monkeypatch.setenv("NEON_PROJECT_ID", "test-project")
+        pytester.makepyfile(
+            """
+            from unittest.mock import patch
+
+            from pytest_neon.plugin import NeonConfig, _get_neon_config
+
+            def test_resolved_once(request):
+                first = _get_neon_config(request.config)
+                with patch.object(NeonConfig, "from_pytest_config") as mock_from:
+                    second = _get_neon_config(request.config)
+                mock_from.assert_not_called()
+                assert second is first
+                assert first.project_id == "test-project"
+            """
+        )
+
+        result = pytester.runpytest("-v")
+        result.assert_outcomes(passed=1)
+
+    def test_role_password_read_from_env(self, pytester, monkeypatch):
+        """NEON_ROLE_PASSWORD is picked up into the resolved config."""
+        monkeypatch.setenv("NEON_API_KEY", "test-key")
+        monkeypatch.setenv("NEON_PROJECT_ID", "test-project")
+        monkeypatch.setenv("NEON_ROLE_PASSWORD", "s3cret")
+        pytester.makepyfile(
+            """
+            from pytest_neon.plugin import _get_neon_config
+
+            def test_role_password(request):
+                assert _get_neon_config(request.config).role_password == "s3cret"
+            """
+        )
+
+        result = pytester.runpytest("-v")
+        result.assert_outcomes(passed=1)
+
+    def test_empty_role_password_is_unset(self, pytester, monkeypatch):
+        """An empty NEON_ROLE_PASSWORD leaves the password to be revealed."""
+        monkeypatch.setenv("NEON_API_KEY", "test-key")
+        monkeypatch.setenv("NEON_PROJECT_ID", "test-project")
+        monkeypatch.setenv("NEON_ROLE_PASSWORD", "")
+        pytester.makepyfile(
+            """
+            from pytest_neon.plugin import _get_neon_config
+
+            def test_role_password(request):
+                assert _get_neon_config(request.config).role_password is None
+            """
+        )
+
+        result = pytester.runpytest("-v")
+        result.assert_outcomes(passed=1)
+        result.stdout.no_fnmatch_line("*NEON_ROLE_PASSWORD*")
+
+    def test_role_password_noted_in_header(self, pytester, monkeypatch):
+        """The session header says when NEON_ROLE_PASSWORD is used."""
+        monkeypatch.setenv("NEON_API_KEY", "test-key")
+        monkeypatch.setenv("NEON_PROJECT_ID", "test-project")
+        monkeypatch.setenv("NEON_ROLE_PASSWORD", "s3cret")
+        pytester.makepyfile(
+            """
+            def test_nothing():
+                pass
+            """
+        )
+
+        result = pytester.runpytest("-v")
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["*role password from NEON_ROLE_PASSWORD*"])
+        result.stdout.no_fnmatch_line("*s3cret*")
+
+    def test_rejected_role_password_warns(self, pytester, monkeypatch):
+        """An auth failure with NEON_ROLE_PASSWORD set points at the variable."""
+        monkeypatch.setenv("NEON_API_KEY", "test-key")
+        monkeypatch.setenv("NEON_PROJECT_ID", "test-project")
+        monkeypatch.setenv("NEON_ROLE_PASSWORD", "stale")
+        pytester.makepyfile(
+            """
+            import pytest
+            from pytest_neon.plugin import _role_password_hint
+
+            def test_auth_failure(request):
+                error = Exception(
+                    'password authentication failed for user "neondb_owner"'
+                )
+                with pytest.warns(UserWarning, match="NEON_ROLE_PASSWORD"):
+                    with pytest.raises(Exception) as excinfo:
+                        with _role_password_hint(request.config):
+                            raise error
+                assert excinfo.value is error
+
+            def test_other_failure(request):
+                with pytest.raises(ValueError):
+                    with _role_password_hint(request.config):
+                        raise ValueError("connection refused")
+            """
+        )
+
+        result = pytester.runpytest("-v", "-W", "error::UserWarning")
+        result.assert_outcomes(passed=2)
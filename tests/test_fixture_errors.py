@@ -28,3 +28,29 @@ sys.modules['psycopg2'] = None
         # Should show install command and suggest neon_branch alternative
         result.stdout.fnmatch_lines(["*pip install pytest-neon*"])
         result.stdout.fnmatch_lines(["*neon_branch*"])
+
+    def test_missing_dependency_fails_every_test_using_fixture(
+        self, pytester, mock_neon_branch_fixture_code
+    ):
+        """Test that a cached failed import still fails each later test."""
+        pytester.makeconftest(
+            mock_neon_branch_fixture_code
+            + """
+import sys
+sys.modules['sqlalchemy'] = None
+"""
+        )
+
+        pytester.makepyfile(
+            """
+            def test_first(neon_engine):
+                pass
+
+            def test_second(neon_engine):
+                pass
+            """
+        )
+
+        result = pytester.runpytest("-v")
+        result.assert_outcomes(errors=2)
+        result.stdout.fnmatch_lines(["*pip install pytest-neon*sqlalchemy*"])
@@ -0,0 +1,24 @@
+"""Tests for the lazy public API in pytest_neon/__init__.py."""
+
+import pytest
+
+import pytest_neon
+from pytest_neon import plugin
+
+
+class TestLazyExports:
+    """Public names resolve from the plugin module on first access."""
+
+    def test_public_names_resolve_to_plugin_objects(self):
+        """Each name in __all__ is the same object as in pytest_neon.plugin."""
+        for name in pytest_neon.__all__:
+            assert getattr(pytest_neon, name) is getattr(plugin, name)
+
+    def test_unknown_attribute_raises(self):
+        """Names outside __all__ raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'not_a_thing'"):
+            pytest_neon.not_a_thing  # noqa: B018
+
+    def test_dir_lists_public_names(self):
+        """dir() includes the lazily-resolved public names."""
+        assert set(pytest_neon.__all__) <= set(dir(pytest_neon))
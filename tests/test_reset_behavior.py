@@ -6,6 +6,7 @@ import requests
 from pytest_neon.plugin import (
     NeonRateLimitError,
     _calculate_retry_delay,
+    _get_retry_after_from_error,
     _is_rate_limit_error,
     _retry_on_rate_limit,
 )
@@ -34,7 +35,9 @@ class TestRateLimitRetryHelper:
             "pytest_neon.plugin.time.sleep", lambda x: sleep_calls.append(x)
         )
         # Mock random for deterministic jitter
-        monkeypatch.setattr("pytest_neon.plugin.random.random", lambda: 0.5)
+        monkeypatch.setattr(
+            "pytest_neon.plugin._retry_rng.uniform", lambda low, high: high
+        )
 
         call_count = [0]
 
@@ -61,7 +64,9 @@ class TestRateLimitRetryHelper:
             "pytest_neon.plugin.time.sleep", lambda x: sleep_calls.append(x)
         )
         # Mock random for deterministic jitter
-        monkeypatch.setattr("pytest_neon.plugin.random.random", lambda: 0.5)
+        monkeypatch.setattr(
+            "pytest_neon.plugin._retry_rng.uniform", lambda low, high: high
+        )
 
         def operation():
             response = requests.Response()
@@ -149,7 +154,9 @@ class TestRateLimitRetryHelper:
         monkeypatch.setattr(
             "pytest_neon.plugin.time.sleep", lambda x: sleep_calls.append(x)
         )
-        monkeypatch.setattr("pytest_neon.plugin.random.random", lambda: 0.5)
+        monkeypatch.setattr(
+            "pytest_neon.plugin._retry_rng.uniform", lambda low, high: high
+        )
 
         def operation():
             response = requests.Response()
@@ -169,37 +176,160 @@ class TestRateLimitRetryHelper:
         assert "Max attempts (3) reached" in str(exc_info.value)
         assert len(sleep_calls) == 2  # 3 attempts = 2 sleeps (before retry 2 and 3)
 
+    def test_max_delay_caps_each_backoff(self, monkeypatch):
+        """Verify max_delay bounds every computed backoff delay."""
+        sleep_calls = []
+        monkeypatch.setattr(
+            "pytest_neon.plugin.time.sleep", lambda x: sleep_calls.append(x)
+        )
+        monkeypatch.setattr(
+            "pytest_neon.plugin._retry_rng.uniform", lambda low, high: high
+        )
+
+        call_count = [0]
 
-class TestCalculateRetryDelay:
-    """Test the delay calculation with exponential backoff and jitter."""
+        def operation():
+            call_count[0] += 1
+            if call_count[0] < 4:
+                response = requests.Response()
+                response.status_code = 429
+                raise requests.HTTPError(response=response)
+            return "success"
+
+        result = _retry_on_rate_limit(
+            operation, "test_operation", base_delay=4.0, max_delay=5.0
+        )
+        assert result == "success"
+        assert sleep_calls == [4.0, 5.0, 5.0]
+
+    def test_shared_budget_caps_delay_across_operations(self, monkeypatch):
+        """Verify a shared budget limits total backoff across several calls."""
+        from pytest_neon.plugin import _RetryBudget
+
+        sleep_calls = []
+        monkeypatch.setattr(
+            "pytest_neon.plugin.time.sleep", lambda x: sleep_calls.append(x)
+        )
+
+        def make_operation():
+            call_count = [0]
+
+            def operation():
+                call_count[0] += 1
+                if call_count[0] < 2:
+                    response = requests.Response()
+                    response.status_code = 429
+                    response.headers["Retry-After"] = "6"
+                    raise requests.HTTPError(response=response)
+                return "success"
+
+            return operation
 
-    def test_exponential_backoff(self, monkeypatch):
-        """Verify exponential backoff without jitter."""
-        # No jitter for deterministic test
-        monkeypatch.setattr("pytest_neon.plugin.random.random", lambda: 0.5)
+        budget = _RetryBudget(max_total_delay=10.0)
 
-        # With jitter_factor=0.25 and random=0.5, jitter = delay * 0.25 * 0 = 0
-        delay0 = _calculate_retry_delay(0, base_delay=4.0, jitter_factor=0.0)
-        delay1 = _calculate_retry_delay(1, base_delay=4.0, jitter_factor=0.0)
-        delay2 = _calculate_retry_delay(2, base_delay=4.0, jitter_factor=0.0)
-        delay3 = _calculate_retry_delay(3, base_delay=4.0, jitter_factor=0.0)
+        # First operation spends 6s of the 10s budget
+        result = _retry_on_rate_limit(make_operation(), "first", budget=budget)
+        assert result == "success"
+        assert budget.total_delay == 6.0
+
+        # Second operation would need another 6s, exceeding the shared budget
+        with pytest.raises(NeonRateLimitError, match="Max total delay"):
+            _retry_on_rate_limit(make_operation(), "second", budget=budget)
+        assert sleep_calls == [6.0]
+
+
+class TestCalculateRetryDelay:
+    """Test the delay calculation with exponential backoff and full jitter."""
+
+    def test_exponential_backoff(self):
+        """Verify the jitter window grows exponentially."""
+        # min_delay_fraction=1.0 collapses the window to the cap
+        delay0 = _calculate_retry_delay(0, base_delay=4.0, min_delay_fraction=1.0)
+        delay1 = _calculate_retry_delay(1, base_delay=4.0, min_delay_fraction=1.0)
+        delay2 = _calculate_retry_delay(2, base_delay=4.0, min_delay_fraction=1.0)
+        delay3 = _calculate_retry_delay(3, base_delay=4.0, min_delay_fraction=1.0)
 
         assert delay0 == 4.0  # 4 * 2^0 = 4
         assert delay1 == 8.0  # 4 * 2^1 = 8
         assert delay2 == 16.0  # 4 * 2^2 = 16
         assert delay3 == 32.0  # 4 * 2^3 = 32
 
-    def test_jitter_adds_randomness(self, monkeypatch):
-        """Verify jitter adds randomness to delay."""
-        # random() = 1.0 -> jitter = delay * 0.25 * (2*1 - 1) = delay * 0.25
-        monkeypatch.setattr("pytest_neon.plugin.random.random", lambda: 1.0)
-        delay_high = _calculate_retry_delay(0, base_delay=4.0, jitter_factor=0.25)
-        assert delay_high == 5.0  # 4 + 4*0.25 = 5
+    def test_cap_bounded_by_max_total_delay(self):
+        """Verify a single delay never exceeds the total delay cap."""
+        delay = _calculate_retry_delay(10, base_delay=4.0, min_delay_fraction=1.0)
+        assert delay == 90.0
+
+    def test_cap_bounded_by_max_delay(self):
+        """Verify a per-route max_delay bounds the cap."""
+        delay = _calculate_retry_delay(
+            3, base_delay=4.0, min_delay_fraction=1.0, max_delay=5.0
+        )
+        assert delay == 5.0
+
+    def test_full_jitter_spans_zero_to_cap(self, monkeypatch):
+        """Verify full jitter draws from the whole [0, cap] window."""
+        bounds = []
+
+        def fake_uniform(low, high):
+            bounds.append((low, high))
+            return high
+
+        monkeypatch.setattr("pytest_neon.plugin._retry_rng.uniform", fake_uniform)
+        _calculate_retry_delay(2, base_delay=4.0)
+        assert bounds == [(0.0, 16.0)]
+
+    def test_jitter_ignores_global_random_seed(self):
+        """Verify reseeding the global random module doesn't synchronize jitter."""
+        import random
+
+        random.seed(1234)
+        first = [_calculate_retry_delay(5, base_delay=4.0) for _ in range(5)]
+        random.seed(1234)
+        second = [_calculate_retry_delay(5, base_delay=4.0) for _ in range(5)]
+        assert first != second
+
+    def test_min_delay_fraction_sets_lower_bound(self):
+        """Verify delays stay within [cap * min_delay_fraction, cap]."""
+        for _ in range(100):
+            delay = _calculate_retry_delay(1, base_delay=4.0, min_delay_fraction=0.5)
+            assert 4.0 <= delay <= 8.0
+
+
+class TestGetRetryAfterFromError:
+    """Test Retry-After header parsing."""
 
-        # random() = 0.0 -> jitter = delay * 0.25 * (2*0 - 1) = -delay * 0.25
-        monkeypatch.setattr("pytest_neon.plugin.random.random", lambda: 0.0)
-        delay_low = _calculate_retry_delay(0, base_delay=4.0, jitter_factor=0.25)
-        assert delay_low == 3.0  # 4 - 4*0.25 = 3
+    def _error_with_retry_after(self, value):
+        response = requests.Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = value
+        return requests.HTTPError(response=response)
+
+    def test_parses_delta_seconds(self):
+        """Verify a numeric Retry-After is returned as seconds."""
+        error = self._error_with_retry_after("7")
+        assert _get_retry_after_from_error(error) == 7.0
+
+    def test_parses_http_date(self):
+        """Verify an HTTP-date Retry-After is converted to seconds from now."""
+        from datetime import datetime, timedelta, timezone
+        from email.utils import format_datetime
+
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        error = self._error_with_retry_after(format_datetime(retry_at, usegmt=True))
+
+        delay = _get_retry_after_from_error(error)
+        assert delay is not None
+        assert 25.0 <= delay <= 30.0
+
+    def test_past_http_date_returns_zero(self):
+        """Verify an HTTP-date in the past means retry immediately."""
+        error = self._error_with_retry_after("Wed, 21 Oct 2015 07:28:00 GMT")
+        assert _get_retry_after_from_error(error) == 0.0
+
+    def test_invalid_value_returns_none(self):
+        """Verify an unparseable Retry-After falls back to backoff."""
+        error = self._error_with_retry_after("soon")
+        assert _get_retry_after_from_error(error) is None
 
 
 class TestIsRateLimitError:
@@ -219,6 +349,20 @@ class TestIsRateLimitError:
         error = requests.HTTPError(response=response)
         assert _is_rate_limit_error(error) is False
 
+    def test_http_error_without_response_is_not_rate_limit(self):
+        """Verify a plain HTTPError with no response is not detected."""
+        error = requests.HTTPError("429 Too Many Requests")
+        assert _is_rate_limit_error(error) is False
+
+    def test_status_code_takes_precedence_over_message(self):
+        """Verify an attached response's status code wins over the message text."""
+        from neon_api.exceptions import NeonAPIError
+
+        response = requests.Response()
+        response.status_code = 500
+        error = NeonAPIError("Rate limit exceeded", response=response)
+        assert _is_rate_limit_error(error) is False
+
     def test_detects_neon_api_error_with_429(self):
         """Verify NeonAPIError with 429 in message is detected."""
         from neon_api.exceptions import NeonAPIError
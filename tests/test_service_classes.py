@@ -6,9 +6,13 @@ wraps the Neon API.
 """
 
 import os
+import threading
+import warnings
 from unittest.mock import MagicMock, patch
 
-from pytest_neon.plugin import EnvironmentManager, XdistCoordinator
+import pytest
+
+from pytest_neon.plugin import EnvironmentManager, NeonBranch, XdistCoordinator
 
 
 class TestEnvironmentManager:
@@ -106,6 +110,24 @@ class TestXdistCoordinator:
         assert is_creator2 is False
         create_fn2.assert_not_called()
 
+    def test_coordinate_resource_reads_cache_without_lock(self, tmp_path):
+        """coordinate_resource() skips the file lock when the cache exists."""
+        mock_tmp_path_factory = MagicMock()
+        mock_tmp_path_factory.getbasetemp.return_value.parent = tmp_path
+        (tmp_path / "neon_resource.json").write_text('{"key": "value"}')
+
+        with patch.dict(os.environ, {"PYTEST_XDIST_WORKER": "gw1"}, clear=False):
+            coordinator = XdistCoordinator(mock_tmp_path_factory)
+
+        create_fn = MagicMock()
+        with patch("filelock.FileLock") as mock_lock:
+            data, is_creator = coordinator.coordinate_resource("resource", create_fn)
+
+        assert data == {"key": "value"}
+        assert is_creator is False
+        mock_lock.assert_not_called()
+        create_fn.assert_not_called()
+
     def test_signal_coordination(self, tmp_path):
         """send_signal() and wait_for_signal() work together."""
         mock_tmp_path_factory = MagicMock()
@@ -117,3 +139,189 @@ class TestXdistCoordinator:
         coordinator.send_signal("migrations_done")
         # Should not raise (signal exists)
         coordinator.wait_for_signal("migrations_done", timeout=1)
+
+    def _make_coordinator(self, tmp_path, worker_id):
+        mock_tmp_path_factory = MagicMock()
+        mock_tmp_path_factory.getbasetemp.return_value.parent = tmp_path
+
+        with patch.dict(os.environ, {"PYTEST_XDIST_WORKER": worker_id}, clear=False):
+            return XdistCoordinator(mock_tmp_path_factory)
+
+    def test_wait_for_signal_blocks_until_sent(self, tmp_path):
+        """wait_for_signal() blocks while the sender holds the barrier."""
+        creator = self._make_coordinator(tmp_path, "gw0")
+        waiter = self._make_coordinator(tmp_path, "gw1")
+        creator.hold_signal("migrations_done")
+
+        errors = []
+
+        def wait():
+            try:
+                waiter.wait_for_signal("migrations_done", timeout=10)
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=wait)
+        thread.start()
+        thread.join(timeout=0.2)
+        assert thread.is_alive()  # Still blocked on the barrier
+
+        creator.send_signal("migrations_done")
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert errors == []
+
+    def test_wait_for_signal_times_out_while_held(self, tmp_path):
+        """wait_for_signal() raises after the timeout if never released."""
+        creator = self._make_coordinator(tmp_path, "gw0")
+        waiter = self._make_coordinator(tmp_path, "gw1")
+        creator.hold_signal("migrations_done")
+
+        try:
+            with pytest.raises(RuntimeError, match="timed out waiting for signal"):
+                waiter.wait_for_signal("migrations_done", timeout=0.1)
+        finally:
+            creator.release_signal("migrations_done")
+
+    def test_wait_for_signal_fails_fast_when_released_unsent(self, tmp_path):
+        """A barrier released without the signal means the creator failed."""
+        creator = self._make_coordinator(tmp_path, "gw0")
+        waiter = self._make_coordinator(tmp_path, "gw1")
+        creator.hold_signal("migrations_done")
+        creator.release_signal("migrations_done")
+
+        with pytest.raises(RuntimeError, match="without sending it"):
+            waiter.wait_for_signal("migrations_done", timeout=10)
+
+    def test_wait_for_all_workers_done_returns_once_all_signal(self, tmp_path):
+        """wait_for_all_workers_done() returns soon after the last worker is done."""
+        mock_tmp_path_factory = MagicMock()
+        mock_tmp_path_factory.getbasetemp.return_value.parent = tmp_path
+
+        env = {"PYTEST_XDIST_WORKER_COUNT": "2"}
+        with patch.dict(os.environ, {**env, "PYTEST_XDIST_WORKER": "gw0"}):
+            creator = XdistCoordinator(mock_tmp_path_factory)
+        with patch.dict(os.environ, {**env, "PYTEST_XDIST_WORKER": "gw1"}):
+            other = XdistCoordinator(mock_tmp_path_factory)
+
+        creator.signal_worker_done()
+        timer = threading.Timer(0.2, other.signal_worker_done)
+        timer.start()
+        # The worker count is read from the environment when first needed
+        with patch.dict(os.environ, env), warnings.catch_warnings():
+            warnings.simplefilter("error")
+            creator.wait_for_all_workers_done(timeout=10)
+        timer.join()
+
+    def test_wait_for_all_workers_done_warns_on_timeout(self, tmp_path):
+        """wait_for_all_workers_done() warns and gives up after the timeout."""
+        mock_tmp_path_factory = MagicMock()
+        mock_tmp_path_factory.getbasetemp.return_value.parent = tmp_path
+
+        env = {"PYTEST_XDIST_WORKER_COUNT": "2", "PYTEST_XDIST_WORKER": "gw0"}
+        with patch.dict(os.environ, env):
+            creator = XdistCoordinator(mock_tmp_path_factory)
+
+            creator.signal_worker_done()
+            with pytest.warns(UserWarning, match="Only 1/2 workers"):
+                creator.wait_for_all_workers_done(timeout=0.2)
+
+
+class TestNeonBranch:
+    """Test the NeonBranch value object."""
+
+    def test_is_immutable_and_hashable(self):
+        """Verify branch info can't be mutated after creation."""
+        import dataclasses
+
+        branch = NeonBranch(
+            branch_id="br-1",
+            project_id="proj-1",
+            connection_string="postgresql://test",
+            host="test.neon.tech",
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            branch.host = "other.neon.tech"  # type: ignore[misc]
+        assert {branch: 1}[branch] == 1
+
+
+class TestNeonBranchManagerWaitForEndpoint:
+    """Test NeonBranchManager endpoint readiness polling."""
+
+    def _make_manager(self, mock_api):
+        from pytest_neon.plugin import NeonBranchManager, NeonConfig
+
+        config = NeonConfig(
+            api_key="test-api-key",
+            project_id="test-project",
+            parent_branch_id=None,
+            database_name="neondb",
+            role_name="neondb_owner",
+            keep_branches=True,
+            branch_expiry=0,
+            env_var_name="DATABASE_URL",
+        )
+        with patch("neon_api.NeonAPI", return_value=mock_api):
+            return NeonBranchManager(config)
+
+    def _endpoint_response(self, state, host="test.neon.tech"):
+        response = MagicMock()
+        response.endpoint.current_state = state
+        response.endpoint.host = host
+        return response
+
+    def test_polls_with_exponential_backoff(self, monkeypatch):
+        """Poll interval doubles between polls until the endpoint is active."""
+        from neon_api.schema import EndpointState
+
+        sleep_calls = []
+        monkeypatch.setattr(
+            "pytest_neon.plugin.time.sleep", lambda x: sleep_calls.append(x)
+        )
+
+        mock_api = MagicMock()
+        mock_api.endpoint.side_effect = [
+            self._endpoint_response(EndpointState.init),
+            self._endpoint_response(EndpointState.init),
+            self._endpoint_response(EndpointState.init),
+            self._endpoint_response(EndpointState.active),
+        ]
+        manager = self._make_manager(mock_api)
+
+        host = manager._wait_for_endpoint("ep-123")
+
+        assert host == "test.neon.tech"
+        assert sleep_calls == [0.25, 0.5, 1.0]
+
+    def test_accepts_raw_string_state(self, monkeypatch):
+        """A plain "active" string state is treated like EndpointState.active."""
+        monkeypatch.setattr("pytest_neon.plugin.time.sleep", lambda x: None)
+
+        mock_api = MagicMock()
+        mock_api.endpoint.return_value = self._endpoint_response("active")
+        manager = self._make_manager(mock_api)
+
+        assert manager._wait_for_endpoint("ep-123") == "test.neon.tech"
+
+    def test_times_out_against_monotonic_deadline(self, monkeypatch):
+        """Timeout is measured on the monotonic clock, not summed sleeps."""
+        from neon_api.schema import EndpointState
+
+        clock = [100.0]
+        monkeypatch.setattr("pytest_neon.plugin.time.monotonic", lambda: clock[0])
+
+        def fake_sleep(seconds):
+            # Each poll takes much longer than the sleep itself
+            clock[0] += seconds + 5
+
+        monkeypatch.setattr("pytest_neon.plugin.time.sleep", fake_sleep)
+
+        mock_api = MagicMock()
+        mock_api.endpoint.return_value = self._endpoint_response(EndpointState.init)
+        manager = self._make_manager(mock_api)
+
+        with pytest.raises(RuntimeError, match="Timeout waiting for endpoint"):
+            manager._wait_for_endpoint("ep-123", max_wait_seconds=10)
+
+        assert mock_api.endpoint.call_count == 3